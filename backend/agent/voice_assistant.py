@@ -9,53 +9,34 @@ sys.stderr = sys.__stderr__
 os.environ['PYTHONUNBUFFERED'] = '1'
 
 import asyncio
-import json
 import signal
-import argparse
-import math
+import logging
+import operator
+import random
 import time
-from datetime import datetime
+import types
+from collections import deque
+from datetime import datetime, timezone
 
 from dotenv import load_dotenv
-import aiohttp
+import orjson
 from redis.asyncio import Redis
-from typing import Optional
+from typing import Deque, Optional, Union
 
 # Import structured logging
-from backend.shared.logging_config import setup_logging
+from backend.shared.logging_config import bind_logger, setup_logging
 # Import database service for transcript storage
 from backend.shared.services import Database
 
-from pipecat.audio.interruptions.min_words_interruption_strategy import MinWordsInterruptionStrategy
-from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import (
-    InterruptionFrame,
-    TranscriptionFrame,
-    TTSSpeakFrame,
-    UserStartedSpeakingFrame,
-    UserStoppedSpeakingFrame,
-)
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.llm_context import LLMContext
-from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
-from pipecat.processors.transcript_processor import TranscriptProcessor
-from pipecat.runner.livekit import configure
-from pipecat.services.inworld.tts import InworldTTSService
-from pipecat.services.assemblyai.stt import AssemblyAISTTService, AssemblyAIConnectionParams
-from pipecat.services.groq.llm import GroqLLMService
-# from pipecat.services.cerebras.llm import CerebrasLLMService  # Temporarily disabled
-from pipecat.transports.livekit.transport import LiveKitParams, LiveKitTransport
+# Pipecat (torch/onnx-backed VAD, STT/LLM/TTS clients, LiveKit) and aiohttp
+# are imported lazily inside main() so env validation and --help stay fast
 
 # =============================================================================
 # PRODUCTION FIX #3: AGENT_ALIVE signal
 # =============================================================================
-# This signal tells Celery that imports completed and the agent process is alive.
-# Must be printed AFTER all imports complete but BEFORE any slow operations.
+# This signal tells Celery that module imports completed and the agent process is alive.
+# Must be printed AFTER module imports but BEFORE any slow operations (the heavy
+# pipecat imports happen later, in main()).
 # This enables faster failure detection for crashed vs slow agents.
 print("AGENT_ALIVE", flush=True)
 sys.stdout.flush()
@@ -67,6 +48,26 @@ load_dotenv(override=True)
 logger = setup_logging(service_name='voice-agent')
 
 
+# Conversation end in one round-trip: read the start time, then write the
+# duration (ceil minutes), status and lastActive. ARGV[1] is the current
+# Unix time; returns {duration, minutes}, or nil when no start was tracked.
+_TRACK_END_SCRIPT = """
+local start = tonumber(redis.call('HGET', KEYS[1], 'conversationStartTime'))
+if not start then
+    return false
+end
+local now = tonumber(ARGV[1])
+local duration = now - start
+local minutes = math.floor((duration + 59) / 60)
+redis.call('HSET', KEYS[1],
+    'conversationDuration', duration,
+    'conversationDurationMinutes', minutes,
+    'status', 'completed',
+    'lastActive', now)
+return {duration, minutes}
+"""
+
+
 class RedisTracker:
     """
     Optional Redis tracker for conversation metrics.
@@ -81,55 +82,59 @@ class RedisTracker:
     - Timeout protection: Never hang indefinitely
     """
 
-    def __init__(self, redis_pool: Optional[Redis] = None):
+    def __init__(self, session_id: str, redis_pool: Optional[Redis] = None):
         """
-        Initialize tracker with optional Redis connection pool.
+        Initialize tracker for one session with optional Redis connection pool.
 
         Args:
+            session_id: Session/room identifier
             redis_pool: Async Redis connection pool. If None, all operations
                        will be skipped gracefully.
         """
+        self.session_id = session_id
+        # Keys and the log prefix are fixed for the session, so build them once
+        self.session_key = f'session:{session_id}'
+        self.cleanup_key = f'session:{session_id}:cleanup_complete'
+        self.log_prefix = session_id[:20]
         self.pool = redis_pool
         if redis_pool:
+            self._end_script = redis_pool.register_script(_TRACK_END_SCRIPT)
             logger.info("redis_tracker_initialized")
         else:
             logger.info("redis_tracker_disabled")
 
-    async def track_conversation_start(self, session_id: str) -> bool:
+    async def track_conversation_start(self) -> bool:
         """
         Track conversation start time (non-critical operation).
 
         Stores the Unix timestamp when the first participant joins.
         Used later to calculate conversation duration.
 
-        Args:
-            session_id: Session/room identifier
-
         Returns:
             True if tracking succeeded, False otherwise (agent continues either way)
         """
         if not self.pool:
-            logger.debug(f"redis_pool_unavailable session={session_id[:20]}...")
+            logger.debug("redis_pool_unavailable session=%s...", self.log_prefix)
             return False
 
         try:
             conversation_start_time = int(time.time())
             await self.pool.hset(
-                f'session:{session_id}',
+                self.session_key,
                 'conversationStartTime',
                 conversation_start_time
             )
-            logger.info(f"conversation_start_tracked session={session_id[:20]}... start_time={conversation_start_time}")
+            logger.info("conversation_start_tracked session=%s... start_time=%s", self.log_prefix, conversation_start_time)
             return True
         except asyncio.TimeoutError:
-            logger.warning(f"redis_timeout_start session={session_id[:20]}... timeout_after=2s")
+            logger.warning("redis_timeout_start session=%s... timeout_after=2s", self.log_prefix)
         except ConnectionError as e:
-            logger.warning(f"redis_connection_error_start session={session_id[:20]}... error={e}")
+            logger.warning("redis_connection_error_start session=%s... error=%s", self.log_prefix, e)
         except Exception as e:
-            logger.warning(f"redis_error_start session={session_id[:20]}... error={e}")
+            logger.warning("redis_error_start session=%s... error=%s", self.log_prefix, e)
         return False
 
-    async def track_conversation_end(self, session_id: str) -> bool:
+    async def track_conversation_end(self) -> bool:
         """
         Track conversation end, calculate duration, and update status (non-critical).
 
@@ -140,55 +145,39 @@ class RedisTracker:
         - Duration tracking (lines 536-549 in original)
         - Status update (lines 590-599 in original)
 
-        Args:
-            session_id: Session/room identifier
-
         Returns:
             True if tracking succeeded, False otherwise (agent continues either way)
         """
         if not self.pool:
-            logger.debug(f"redis_pool_unavailable session={session_id[:20]}...")
+            logger.debug("redis_pool_unavailable session=%s...", self.log_prefix)
             return False
 
         try:
-            # Retrieve conversation start time
-            start_time = await self.pool.hget(
-                f'session:{session_id}',
-                'conversationStartTime'
+            # One round-trip: the script reads the start time and writes the
+            # duration and status atomically on the server
+            result = await self._end_script(
+                keys=[self.session_key],
+                args=[int(time.time())]
             )
 
-            if start_time:
-                # Calculate duration
-                duration = int(time.time()) - int(start_time)
-                duration_minutes = math.ceil(duration / 60)
-
-                # Update all fields atomically in a single HSET
-                # This combines duration tracking and status update
-                await self.pool.hset(
-                    f'session:{session_id}',
-                    mapping={
-                        'conversationDuration': duration,
-                        'conversationDurationMinutes': duration_minutes,
-                        'status': 'completed',
-                        'lastActive': int(time.time())
-                    }
-                )
+            if result:
+                duration, duration_minutes = result
                 logger.info(
-                    f"conversation_end_tracked session={session_id[:20]}... "
-                    f"duration={duration}s duration_minutes={duration_minutes}"
+                    "conversation_end_tracked session=%s... duration=%ss duration_minutes=%s",
+                    self.log_prefix, duration, duration_minutes
                 )
                 return True
             else:
-                logger.warning(f"no_start_time_found session={session_id[:20]}...")
+                logger.warning("no_start_time_found session=%s...", self.log_prefix)
         except asyncio.TimeoutError:
-            logger.warning(f"redis_timeout_end session={session_id[:20]}... timeout_after=2s")
+            logger.warning("redis_timeout_end session=%s... timeout_after=2s", self.log_prefix)
         except ConnectionError as e:
-            logger.warning(f"redis_connection_error_end session={session_id[:20]}... error={e}")
+            logger.warning("redis_connection_error_end session=%s... error=%s", self.log_prefix, e)
         except Exception as e:
-            logger.warning(f"redis_error_end session={session_id[:20]}... error={e}")
+            logger.warning("redis_error_end session=%s... error=%s", self.log_prefix, e)
         return False
 
-    async def signal_cleanup_complete(self, session_id: str, transcript_saved: bool) -> bool:
+    async def signal_cleanup_complete(self, transcript_saved: bool) -> bool:
         """
         Signal that agent cleanup is complete (transcript saved, ready for orchestrator).
 
@@ -196,39 +185,42 @@ class RedisTracker:
         The orchestrator waits for this signal before returning from cleanup_session.
 
         Args:
-            session_id: Session/room identifier
             transcript_saved: Whether transcript was successfully saved to database
 
         Returns:
             True if signal was sent successfully, False otherwise
         """
         if not self.pool:
-            logger.warning(f"redis_pool_unavailable_for_cleanup_signal session={session_id[:20]}...")
+            logger.warning("redis_pool_unavailable_for_cleanup_signal session=%s...", self.log_prefix)
             return False
 
         try:
-            cleanup_key = f"session:{session_id}:cleanup_complete"
+            cleanup_key = self.cleanup_key
             cleanup_data = {
                 'completed': 'true',
                 'transcript_saved': 'true' if transcript_saved else 'false',
                 'completed_at': str(int(time.time()))
             }
 
-            # Set completion signal with 60 second TTL (orchestrator should read within seconds)
-            await self.pool.hset(cleanup_key, mapping=cleanup_data)
-            await self.pool.expire(cleanup_key, 60)
+            # Set completion signal with 60 second TTL (orchestrator should read within seconds).
+            # MULTI/EXEC sends both commands in one round-trip and never leaves
+            # the key without its TTL
+            async with self.pool.pipeline(transaction=True) as pipe:
+                pipe.hset(cleanup_key, mapping=cleanup_data)
+                pipe.expire(cleanup_key, 60)
+                await pipe.execute()
 
             logger.info(
-                f"cleanup_complete_signal_sent session={session_id[:20]}... "
-                f"transcript_saved={transcript_saved}"
+                "cleanup_complete_signal_sent session=%s... transcript_saved=%s",
+                self.log_prefix, transcript_saved
             )
             return True
         except asyncio.TimeoutError:
-            logger.warning(f"redis_timeout_cleanup_signal session={session_id[:20]}... timeout_after=2s")
+            logger.warning("redis_timeout_cleanup_signal session=%s... timeout_after=2s", self.log_prefix)
         except ConnectionError as e:
-            logger.warning(f"redis_connection_error_cleanup_signal session={session_id[:20]}... error={e}")
+            logger.warning("redis_connection_error_cleanup_signal session=%s... error=%s", self.log_prefix, e)
         except Exception as e:
-            logger.warning(f"redis_error_cleanup_signal session={session_id[:20]}... error={e}")
+            logger.warning("redis_error_cleanup_signal session=%s... error=%s", self.log_prefix, e)
         return False
 
 
@@ -238,6 +230,24 @@ class RedisTracker:
 ENABLE_TIMING = os.getenv('LOG_LEVEL', 'INFO').upper() == 'DEBUG'
 PARTICIPANT_GREETING_DELAY = 0.2
 
+# Redis (conversation tracking, optional)
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379')
+REDIS_MAX_CONNECTIONS = 4
+
+# Orchestrator (credit billing heartbeat)
+ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://orchestrator:8000")
+HEARTBEAT_INTERVAL = 60
+HEARTBEAT_JITTER = 5  # Max extra seconds before the first beat
+
+# Transcript checkpointing (the final save still happens at shutdown)
+TRANSCRIPT_CHECKPOINT_INTERVAL = 30
+
+# Upper bounds for the shutdown cleanup stages, so a stuck socket can't hold
+# the process open indefinitely. The orchestrator polls for the cleanup
+# signal for 10 s, so both stages together must finish well inside that
+CLEANUP_SAVE_TIMEOUT = 6.0
+CLEANUP_SIGNAL_TIMEOUT = 2.0
+
 # Context Aggregator Settings
 AGGREGATION_TIMEOUT = 0.2
 BOT_INTERRUPTION_TIMEOUT = 0.1
@@ -247,14 +257,15 @@ TTS_STREAMING = True
 TTS_TEMPERATURE = 0.8
 TTS_DEFAULT_SPEED = 1.0
 
-VOICE_SPEED_OVERRIDES = {
+# Read-only view: shared process-wide, never mutated per session
+VOICE_SPEED_OVERRIDES = types.MappingProxyType({
     "Craig": 1.2,
     "Edward": 1.0,
     "Olivia": 1.0,
     "Wendy": 1.2,
     "Priya": 1.0,
     "Ashley": 1.0,
-}
+})
 
 # STT Configuration (AssemblyAI)
 STT_SAMPLE_RATE = 16000
@@ -277,7 +288,7 @@ LLM_STREAM = True
 LLM_MAX_TOKENS = 100
 LLM_TEMPERATURE = 0.1
 
-# Critical Rules (appended to all system prompts)
+# Critical Rules (sent ahead of every system prompt)
 CRITICAL_RULES = """
 <role>Simulated role player in a formal exam. Responses spoken via a text-to-speech system, so follow these rules strictly</role>
 
@@ -337,33 +348,137 @@ Finally, you must strictly follow the script given and those instructions.
 
 """.strip()
 
+# Leading system message shared by every session (see main())
+CRITICAL_RULES_MESSAGE = {"role": "system", "content": CRITICAL_RULES}
+
+# Script used when the session doesn't provide one
+DEFAULT_SYSTEM_PROMPT = "You are a role player actor so follow the script and the critical rules strictly."
+DEFAULT_SYSTEM_MESSAGE = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
 # ==================== END CONFIGURATION ====================
 
+# Required environment variables and their descriptions
+_REQUIRED_ENV = (
+    ('ASSEMBLY_API_KEY', 'AssemblyAI API key for speech-to-text'),
+    ('GROQ_API_KEY', 'Groq API key for LLM'),
+    ('INWORLD_API_KEY', 'Inworld API key for text-to-speech'),
+)
+
 def validate_environment():
     """Validate that all required environment variables are set."""
-    required_vars = {
-        'ASSEMBLY_API_KEY': 'AssemblyAI API key for speech-to-text',
-        'GROQ_API_KEY': 'Groq API key for LLM',
-        'INWORLD_API_KEY': 'Inworld API key for text-to-speech',
-    }
-
-    missing = []
-    for var, description in required_vars.items():
-        if not os.getenv(var):
-            missing.append(f"  - {var}: {description}")
+    env = os.environ
+    missing = [
+        f"  - {var}: {description}"
+        for var, description in _REQUIRED_ENV
+        if not env.get(var)
+    ]
 
     if missing:
-        logger.error(f"environment_validation_failed missing_variables={missing}")
+        logger.error("environment_validation_failed missing_variables=%s", missing)
         sys.exit(1)
 
     logger.info("environment_validated")
 
 validate_environment()
 
-def log_timing(message: str):
-    """Log timing information only in development mode"""
-    if ENABLE_TIMING:
-        logger.debug(f"TIMING: {message}")
+# Read once after validation; services never re-read the environment
+ASSEMBLY_API_KEY = os.environ['ASSEMBLY_API_KEY']
+GROQ_API_KEY = os.environ['GROQ_API_KEY']
+INWORLD_API_KEY = os.environ['INWORLD_API_KEY']
+
+def json_dumps(obj) -> str:
+    """orjson-backed json.dumps replacement (aiohttp expects a str)"""
+    return orjson.dumps(obj).decode()
+
+
+# Process-wide aiohttp session for Inworld TTS, created lazily by get_session()
+_http_session = None
+
+
+async def get_session():
+    """
+    Get or create the process-wide aiohttp session.
+
+    The tuned connector keeps TLS connections to Inworld warm and caches DNS
+    so streamed TTS requests don't pay a handshake per burst. The session
+    outlives main() and is closed once by close_session() at process exit.
+    """
+    global _http_session
+    import aiohttp
+
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            json_serialize=json_dumps,
+        )
+    return _http_session
+
+
+async def close_session():
+    """Close the process-wide aiohttp session if it was created."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        try:
+            await _http_session.close()
+        except Exception as e:
+            logger.error("session_close_error: %s", e)
+    _http_session = None
+
+
+# Process-wide Redis client for RedisTracker, created lazily by get_redis()
+_redis_client: Optional[Redis] = None
+
+
+async def get_redis() -> Redis:
+    """
+    Get or create the process-wide async Redis client.
+
+    Tracker operations are short and sequential, so a small pool is enough;
+    the client outlives main() and is closed once by close_redis().
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = await Redis.from_url(
+            REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            socket_connect_timeout=2,        # 2 second connection timeout
+            socket_timeout=2,                # 2 second operation timeout
+            socket_keepalive=True,           # Keep connections alive
+            health_check_interval=30         # Check connection health every 30s
+        )
+        logger.info("redis_pool_created max_connections=%s timeout=2s", REDIS_MAX_CONNECTIONS)
+    return _redis_client
+
+
+async def close_redis():
+    """Close the process-wide Redis client if it was created."""
+    global _redis_client
+    if _redis_client is not None:
+        try:
+            # aclose() also disconnects the pool created by from_url()
+            await _redis_client.aclose()
+            logger.info("redis_pool_closed")
+        except Exception as e:
+            logger.error("redis_pool_cleanup_error: %s", e)
+    _redis_client = None
+
+
+# Bound once at import so callers pay nothing for the check when timing is off
+if ENABLE_TIMING:
+    def log_timing(message: str):
+        """Log timing information (development mode)"""
+        logger.debug("TIMING: %s", message)
+else:
+    def log_timing(message: str):
+        """No-op outside development mode"""
 
 
 # =============================================================================
@@ -413,23 +528,23 @@ class AgentStatusReporter:
             if details:
                 data["details"] = details
 
-            json_data = json.dumps(data)
+            json_data = json_dumps(data)
 
             # Fire and forget - don't block pipeline for status updates
             asyncio.create_task(self._send_message(json_data))
 
             self._last_status = status
-            logger.debug(f"status_update_sent status={status} message={message}")
+            logger.debug("status_update_sent status=%s message=%s", status, message)
 
         except Exception as e:
-            logger.warning(f"status_update_failed status={status} error={str(e)}")
+            logger.warning("status_update_failed status=%s error=%s", status, e)
 
     async def _send_message(self, data: str):
         """Internal method to send message with error handling."""
         try:
             await self.transport.send_message(data)
         except Exception as e:
-            logger.warning(f"send_message_failed error={str(e)}")
+            logger.warning("send_message_failed error=%s", e)
 
     async def report_initializing(self, component: str = None):
         """Report that agent is initializing."""
@@ -459,45 +574,69 @@ class TranscriptionReporter:
 
     def __init__(self, transport):
         self.transport = transport
+        # Created inside the running loop, so bind its clock once instead of
+        # looking the loop up per message
+        self._clock = asyncio.get_running_loop().time
+        # Encoded messages awaiting send. A single drainer replaces a task per
+        # message and keeps notifications in the order they were reported
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._drainer = asyncio.create_task(self._drain())
         logger.info("TranscriptionReporter initialized")
 
+    async def _drain(self):
+        """Send queued notifications in order; a failed send is logged and skipped."""
+        while True:
+            data = await self._outbox.get()
+            try:
+                await self.transport.send_message(data)
+            except Exception as e:
+                logger.warning("send_message_failed error=%s", e)
+
+    def close(self):
+        """Stop the drainer; notifications still queued are dropped."""
+        self._drainer.cancel()
+
     async def report_user_transcript(self, text: str, timestamp: float = None):
         """Send user transcription to frontend for latency tracking"""
         try:
             if timestamp is None:
-                timestamp = asyncio.get_event_loop().time()
+                timestamp = self._clock()
 
-            data = json.dumps({
+            data = json_dumps({
                 "type": "transcription",
                 "speaker": "user",
                 "text": text,
                 "timestamp": timestamp
             })
 
-            # Fire and forget - don't block audio pipeline for frontend notifications
-            asyncio.create_task(self.transport.send_message(data))
-            logger.debug(f"Sent user transcript to frontend: {text[:50]}...")
+            # Queue without awaiting - don't block audio pipeline for frontend notifications
+            self._outbox.put_nowait(data)
+            logger.debug("Sent user transcript to frontend: %d chars", len(text))
         except Exception as e:
-            logger.error(f"Failed to send user transcript: {e}")
+            logger.error("Failed to send user transcript: %s", e)
 
     async def report_assistant_transcript(self, text: str, timestamp: float = None):
         """Send assistant transcription to frontend (for full cycle tracking)"""
         try:
             if timestamp is None:
-                timestamp = asyncio.get_event_loop().time()
+                timestamp = self._clock()
 
-            data = json.dumps({
+            data = json_dumps({
                 "type": "transcription",
                 "speaker": "assistant",
                 "text": text,
                 "timestamp": timestamp
             })
 
-            # Fire and forget - don't block audio pipeline for frontend notifications
-            asyncio.create_task(self.transport.send_message(data))
-            logger.debug(f"Sent assistant transcript to frontend: {text[:50]}...")
+            # Queue without awaiting - don't block audio pipeline for frontend notifications
+            self._outbox.put_nowait(data)
+            logger.debug("Sent assistant transcript to frontend: %d chars", len(text))
         except Exception as e:
-            logger.error(f"Failed to send assistant transcript: {e}")
+            logger.error("Failed to send assistant transcript: %s", e)
+
+
+# Pipecat TranscriptionMessage fields, fetched in one C-level call
+_message_fields = operator.attrgetter('role', 'content', 'timestamp')
 
 
 class TranscriptStorage:
@@ -505,44 +644,113 @@ class TranscriptStorage:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.transcripts = []
-        logger.info(f"TranscriptStorage initialized for session {session_id[:20]}...")
+        # Columnar storage: one deque per field, the sequence is the index.
+        # Appends are O(1) and atomic; lists are built only on persistence
+        self.roles: Deque[str] = deque()
+        self.contents: Deque[str] = deque()
+        # ISO strings from Pipecat, or epoch floats captured locally and
+        # formatted only when the transcript is persisted
+        self.timestamps: Deque[Union[str, float]] = deque()
+        logger.info("TranscriptStorage initialized for session %s...", session_id[:20])
 
     def add_message(self, role: str, content: str, timestamp: str = None):
         """Add a transcript message"""
         if timestamp is None:
-            timestamp = datetime.utcnow().isoformat()
+            timestamp = time.time()
 
-        self.transcripts.append({
-            "role": role,
-            "content": content,
-            "timestamp": timestamp,
-            "sequence": len(self.transcripts)
-        })
-        logger.debug(f"Captured {role} message #{len(self.transcripts)}")
+        self.roles.append(role)
+        self.contents.append(content)
+        self.timestamps.append(timestamp)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Captured %s message #%d", role, len(self.roles))
 
     def get_transcript_data(self):
         """Get formatted transcript data for database storage"""
-        return self.transcripts
+        return [
+            {
+                "role": role,
+                "content": content,
+                "timestamp": timestamp if isinstance(timestamp, str) else datetime.fromtimestamp(
+                    timestamp, timezone.utc
+                ).isoformat(timespec='milliseconds'),
+                "sequence": sequence
+            }
+            for sequence, (role, content, timestamp)
+            in enumerate(zip(self.roles, self.contents, self.timestamps))
+        ]
 
     def __len__(self):
         """Return the number of transcript entries"""
-        return len(self.transcripts)
+        return len(self.roles)
+
+
+async def warm_database_pool():
+    """
+    Open the Postgres pool and its first connection while the session starts up.
+
+    Pipecat service constructors do no network I/O, so the only independent
+    startup handshake is the database one. Acquiring a connection here runs
+    the connect/auth handshake and the per-connection codec and statement
+    setup off the shutdown path, where the orchestrator waits on the
+    transcript save, and surfaces a bad host or bad credentials early.
+    Failures are logged; save_transcript() retries the pool.
+    """
+    try:
+        pool = await Database.get_pool()
+        async with pool.acquire():
+            pass
+        logger.info("database_pool_warmed")
+    except Exception as e:
+        logger.warning("database_pool_warmup_failed error=%s", e)
+
+
+async def transcript_checkpoint_task(session_id: str, transcript_storage: TranscriptStorage):
+    """
+    Periodically persist the transcript while the call is running.
 
+    Bounds what an ungraceful exit can lose to one interval and keeps the
+    shutdown save from being the only write. A save is skipped when no new
+    messages arrived since the last one.
+    """
+    saved_count = 0
+    while True:
+        await asyncio.sleep(TRANSCRIPT_CHECKPOINT_INTERVAL)
+        count = len(transcript_storage)
+        if count == saved_count:
+            continue
+        try:
+            if await Database.save_transcript(session_id, transcript_storage.get_transcript_data()):
+                saved_count = count
+        except Exception as e:
+            logger.warning("transcript_checkpoint_failed session_id=%s error=%s", session_id, e)
 
-async def heartbeat_task(session_id: str, transport=None, transcript_storage=None, heartbeat_session=None):
-    """Send heartbeat to orchestrator every minute for credit billing."""
-    await asyncio.sleep(60)
+
+async def heartbeat_task(session_id: str, heartbeat_session=None, shutdown_event: Optional[asyncio.Event] = None):
+    """
+    Send heartbeat to orchestrator every minute for credit billing.
+
+    On a "stop" response the task sets shutdown_event and returns; main()
+    stops the pipeline and its finally block saves the transcript.
+    """
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    # Jitter the first beat so agents started together don't POST in lockstep
+    deadline = loop.time() + HEARTBEAT_INTERVAL + random.uniform(0, HEARTBEAT_JITTER)
 
     while True:
         try:
-            logger.info(f"heartbeat_sending session_id={session_id}")
+            # Sleep to an absolute deadline so request time doesn't accumulate as drift
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            deadline += HEARTBEAT_INTERVAL
+            if deadline <= loop.time():
+                # Fell a whole interval behind (stalled loop) - skip, don't burst
+                deadline = loop.time() + HEARTBEAT_INTERVAL
 
-            orchestrator_url = os.getenv("ORCHESTRATOR_URL", "http://orchestrator:8000")
+            logger.info("heartbeat_sending session_id=%s", session_id)
 
             if heartbeat_session is None:
-                logger.error(f"heartbeat_session_missing session_id={session_id}")
-                await asyncio.sleep(60)
+                logger.error("heartbeat_session_missing session_id=%s", session_id)
                 continue
 
             # Non-blocking heartbeat with 2-second timeout to prevent event loop blocking
@@ -550,102 +758,98 @@ async def heartbeat_task(session_id: str, transport=None, transcript_storage=Non
             try:
                 async with asyncio.timeout(2):
                     async with heartbeat_session.post(
-                        f"{orchestrator_url}/api/session/heartbeat",
+                        f"{ORCHESTRATOR_URL}/api/session/heartbeat",
                         json={"sessionId": session_id},
                         timeout=aiohttp.ClientTimeout(total=2)  # Reduced from 10s to prevent blocking
                     ) as response:
-                        result = await response.json()
+                        result = await response.json(loads=orjson.loads)
             except asyncio.TimeoutError:
-                # Timeout is not critical - heartbeat will retry in 60s
-                logger.warning(f"heartbeat_timeout session_id={session_id} timeout=2s action=continuing")
-                await asyncio.sleep(60)
+                # Timeout is not critical - heartbeat will retry next interval
+                logger.warning("heartbeat_timeout session_id=%s timeout=2s action=continuing", session_id)
                 continue
             except Exception as e:
-                # Network errors are not critical - heartbeat will retry in 60s
-                logger.warning(f"heartbeat_network_error session_id={session_id} error={str(e)} action=continuing")
-                await asyncio.sleep(60)
+                # Network errors are not critical - heartbeat will retry next interval
+                logger.warning("heartbeat_network_error session_id=%s error=%s action=continuing", session_id, e)
                 continue
 
             if result.get("status") == "stop":
-                logger.warning(f"heartbeat_stop_received session_id={session_id}")
-
-                # Save transcript before stopping
-                if transcript_storage and len(transcript_storage) > 0:
-                    try:
-                        transcript_data = transcript_storage.get_transcript_data()
-                        success = await Database.save_transcript(session_id, transcript_data)
-                        if success:
-                            logger.info(f"Transcript saved before stop: {len(transcript_data)} messages")
-                    except Exception as save_error:
-                        logger.error(f"Failed to save transcript before stop: {save_error}")
-
-                # Close transport if available
-                if transport:
-                    try:
-                        await transport.close()
-                        logger.info("Transport closed due to insufficient credits")
-                    except Exception as close_error:
-                        logger.error(f"Transport close error: {close_error}")
-
-                logger.info("Exiting due to insufficient credits")
-                sys.exit(0)
+                logger.warning("heartbeat_stop_received session_id=%s", session_id)
+                if shutdown_event:
+                    shutdown_event.set()
+                return
 
             elif result.get("status") == "ok":
-                logger.info(f"heartbeat_success credits_remaining={result.get('credits_remaining')}")
-
-            await asyncio.sleep(60)
+                logger.info("heartbeat_success credits_remaining=%s", result.get('credits_remaining'))
 
         except asyncio.CancelledError:
-            logger.info(f"heartbeat_cancelled session_id={session_id}")
+            logger.info("heartbeat_cancelled session_id=%s", session_id)
             break
         except Exception as e:
-            logger.error(f"heartbeat_exception: {e}")
-            await asyncio.sleep(60)
+            logger.error("heartbeat_exception: %s", e)
 
 
 async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
     """Main function to run the voice assistant bot."""
+    import aiohttp
+    from pipecat.audio.interruptions.min_words_interruption_strategy import MinWordsInterruptionStrategy
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    from pipecat.audio.vad.vad_analyzer import VADParams
+    from pipecat.frames.frames import (
+        InterruptionFrame,
+        TranscriptionFrame,
+        TTSSpeakFrame,
+        UserStartedSpeakingFrame,
+        UserStoppedSpeakingFrame,
+    )
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+    from pipecat.processors.aggregators.llm_context import LLMContext
+    from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
+    from pipecat.processors.transcript_processor import TranscriptProcessor
+    from pipecat.runner.livekit import configure
+    from pipecat.services.inworld.tts import InworldTTSService
+    from pipecat.services.assemblyai.stt import AssemblyAISTTService, AssemblyAIConnectionParams
+    from pipecat.services.groq.llm import GroqLLMService
+    # from pipecat.services.cerebras.llm import CerebrasLLMService  # Temporarily disabled
+    from pipecat.transports.livekit.transport import LiveKitParams, LiveKitTransport
+
     session = None
     transport = None
-    redis_pool = None
+    room_name = None
     redis_tracker = None
     status_reporter = None  # PRODUCTION FIX #6
+    db_warmup = None
+    heartbeat_session = None
+    transcript_storage = None
+    transcription_reporter = None  # Created once the first participant joins
 
     try:
-        logger.info(f"voice_assistant_starting voice_id={voice_id}")
+        logger.info("voice_assistant_starting voice_id=%s", voice_id)
+
+        # Connect to Postgres concurrently with the rest of the startup
+        db_warmup = asyncio.create_task(warm_database_pool())
 
         # Configure LiveKit connection
         (url, token, room_name) = await configure()
-        logger.info(f"livekit_configured room_name={room_name}")
+        logger.info("livekit_configured room_name=%s", room_name)
 
         # Initialize Redis connection pool (optional, non-critical)
         # Agent will continue working even if Redis is unavailable
-        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
         try:
-            redis_pool = await Redis.from_url(
-                redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                max_connections=10,              # Pool up to 10 connections
-                socket_connect_timeout=2,        # 2 second connection timeout
-                socket_timeout=2,                # 2 second operation timeout
-                socket_keepalive=True,           # Keep connections alive
-                health_check_interval=30         # Check connection health every 30s
-            )
-            logger.info("redis_pool_created max_connections=10 timeout=2s")
-            redis_tracker = RedisTracker(redis_pool)
+            redis_tracker = RedisTracker(room_name, await get_redis())
         except asyncio.TimeoutError:
-            logger.warning(f"redis_pool_creation_timeout url={redis_url} timeout=2s")
+            logger.warning("redis_pool_creation_timeout url=%s timeout=2s", REDIS_URL)
             logger.info("continuing_without_redis_tracking")
-            redis_tracker = RedisTracker(None)
+            redis_tracker = RedisTracker(room_name)
         except ConnectionError as e:
-            logger.warning(f"redis_pool_connection_failed url={redis_url} error={e}")
+            logger.warning("redis_pool_connection_failed url=%s error=%s", REDIS_URL, e)
             logger.info("continuing_without_redis_tracking")
-            redis_tracker = RedisTracker(None)
+            redis_tracker = RedisTracker(room_name)
         except Exception as e:
-            logger.warning(f"redis_pool_creation_failed url={redis_url} error={e}")
+            logger.warning("redis_pool_creation_failed url=%s error=%s", REDIS_URL, e)
             logger.info("continuing_without_redis_tracking")
-            redis_tracker = RedisTracker(None)
+            redis_tracker = RedisTracker(room_name)
 
         # Create transport
         transport = LiveKitTransport(
@@ -667,13 +871,10 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
         # Create STT service (AssemblyAI only)
         stt_service_name = "unknown"
 
-        if not os.getenv("ASSEMBLY_API_KEY"):
-            raise Exception("ASSEMBLY_API_KEY is required for STT service")
-
         try:
             logger.info("Initializing AssemblyAI STT service")
             stt = AssemblyAISTTService(
-                api_key=os.getenv("ASSEMBLY_API_KEY"),
+                api_key=ASSEMBLY_API_KEY,
                 api_endpoint_base_url="wss://streaming.eu.assemblyai.com/v3/ws",
                 connection_params=AssemblyAIConnectionParams(
                     sample_rate=STT_SAMPLE_RATE,
@@ -692,28 +893,37 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                 language=STT_LANGUAGE,
             )
             stt_service_name = f"AssemblyAI ({STT_MODEL})"
-            logger.info(f"stt_service_initialized service=AssemblyAI model={STT_MODEL}")
+            logger.info("stt_service_initialized service=AssemblyAI model=%s", STT_MODEL)
         except Exception as e:
-            logger.error(f"assemblyai_stt_failed error={str(e)}")
+            logger.error("assemblyai_stt_failed error=%s", e)
             raise Exception(f"AssemblyAI STT service failed. Cannot proceed.") from e
 
-        logger.info(f"stt_service_active service={stt_service_name}")
+        logger.info("stt_service_active service=%s", stt_service_name)
 
         # Create LLM service (Groq)
         llm = GroqLLMService(
-            api_key=os.getenv("GROQ_API_KEY"),
+            api_key=GROQ_API_KEY,
             model=LLM_MODEL,
             stream=LLM_STREAM,
             max_tokens=LLM_MAX_TOKENS,
             temperature=LLM_TEMPERATURE,
         )
-        logger.info(f"groq_llm_initialized model={LLM_MODEL} temperature={LLM_TEMPERATURE} max_tokens={LLM_MAX_TOKENS}")
-
-        # Create aiohttp session for InworldTTS
-        session = aiohttp.ClientSession()
-
-        # Create dedicated aiohttp session for heartbeat
-        heartbeat_session = aiohttp.ClientSession()
+        logger.info("groq_llm_initialized model=%s temperature=%s max_tokens=%s", LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS)
+
+        # Shared aiohttp session for InworldTTS (closed at process exit)
+        session = await get_session()
+
+        # Heartbeat session borrows the TTS connector so both share one DNS
+        # cache and SSL context. One request a minute to uvicorn, which drops
+        # idle keep-alive connections after 5 s (and serves HTTP/1.1 only), so
+        # a connection can never be reused between beats: ask for it to be
+        # closed after each response instead of parking it in the pool.
+        heartbeat_session = aiohttp.ClientSession(
+            connector=session.connector,
+            connector_owner=False,
+            headers={'Connection': 'close'},
+            json_serialize=json_dumps,
+        )
         logger.info("heartbeat_session_created")
 
         # Create TTS service (Inworld)
@@ -721,7 +931,7 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
         # Only temperature is available in InputParams
         voice_speed = VOICE_SPEED_OVERRIDES.get(voice_id, TTS_DEFAULT_SPEED)
         tts = InworldTTSService(
-            api_key=os.getenv("INWORLD_API_KEY"),
+            api_key=INWORLD_API_KEY,
             aiohttp_session=session,
             voice_id=voice_id,
             model="inworld-tts-1.5-mini",
@@ -731,13 +941,16 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                 # speed parameter not supported by Pipecat's InworldTTSService yet
             ),
         )
-        logger.info(f"inworld_tts_initialized voice_id={voice_id} temperature={TTS_TEMPERATURE}")
+        logger.info("inworld_tts_initialized voice_id=%s temperature=%s", voice_id, TTS_TEMPERATURE)
 
         # Create conversation context
-        base_prompt = system_prompt or "You are a role player actor so follow the script and the critical rules strictly."
-        full_system_prompt = f"{base_prompt}\n\n{CRITICAL_RULES}"
-
-        messages = [{"role": "system", "content": full_system_prompt}]
+        # The fixed CRITICAL_RULES go first as their own system message so every
+        # session shares an identical prompt prefix the provider can cache;
+        # the per-session script follows
+        messages = [
+            CRITICAL_RULES_MESSAGE,
+            {"role": "system", "content": system_prompt} if system_prompt else DEFAULT_SYSTEM_MESSAGE,
+        ]
 
         if opening_line:
             messages.append({"role": "assistant", "content": opening_line})
@@ -747,13 +960,10 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
         context_aggregator.aggregation_timeout = AGGREGATION_TIMEOUT
         context_aggregator.bot_interruption_timeout = BOT_INTERRUPTION_TIMEOUT
 
-        # Create transcription reporter (will be initialized after connection)
-        transcription_reporter = None
-
         # Create transcript processor and storage
         transcript_processor = TranscriptProcessor()
         transcript_storage = TranscriptStorage(room_name)
-        logger.info(f"Transcript processor created for session {room_name}")
+        logger.info("Transcript processor created for session %s", room_name)
 
         # Set up transcript event handler
         @transcript_processor.event_handler("on_transcript_update")
@@ -763,18 +973,27 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
 
             if hasattr(transcript, 'messages'):
                 for message in transcript.messages:
-                    role = getattr(message, 'role', 'unknown')
-                    content = getattr(message, 'content', '')
-                    timestamp = getattr(message, 'timestamp', datetime.utcnow().isoformat())
+                    try:
+                        role, content, timestamp = _message_fields(message)
+                    except AttributeError:
+                        role = getattr(message, 'role', 'unknown')
+                        content = getattr(message, 'content', '')
+                        timestamp = getattr(message, 'timestamp', None)
+
+                    # Pipecat only emits finalized messages (interim STT results
+                    # never get here), so the only noise to drop is empty text;
+                    # shorter-than-previous messages are genuine short turns
+                    if not content:
+                        continue
 
                     # Store in transcript storage
                     transcript_storage.add_message(role, content, timestamp)
 
                     # Send transcripts to frontend if reporter is initialized
                     if transcription_reporter:
-                        if role == 'user' and content:
+                        if role == 'user':
                             await transcription_reporter.report_user_transcript(content)
-                        elif role == 'assistant' and content:
+                        elif role == 'assistant':
                             await transcription_reporter.report_assistant_transcript(content)
 
         # Build pipeline with transcript processors
@@ -802,15 +1021,31 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
             ),
         )
 
+        # Set once StartFrame has flowed through the whole pipeline (TTS and
+        # transport output ready); lets the greeting go out without a fixed delay
+        pipeline_ready = asyncio.Event()
+
+        @task.event_handler("on_pipeline_started")
+        async def on_pipeline_started(task, frame):
+            pipeline_ready.set()
+
         cleanup_triggered = False
 
+        # Remote participants in the room, kept current from transport events
+        participant_count = 0
+
+        @transport.event_handler("on_participant_connected")
+        async def on_participant_connected(transport, participant_id, *args):
+            nonlocal participant_count
+            participant_count += 1
+
         @transport.event_handler("on_participant_left")
         async def on_participant_left(transport, participant_id, *args):
-            nonlocal cleanup_triggered
-            logger.info(f"Participant {participant_id} left")
+            nonlocal cleanup_triggered, participant_count
+            participant_count = max(0, participant_count - 1)
+            logger.info("Participant %s left", participant_id)
             try:
-                remaining = getattr(transport, 'participants', [])
-                if len(remaining) == 0:
+                if participant_count == 0:
                     logger.info("No participants remaining - ending session")
                     # PRODUCTION FIX #6: Send disconnected status
                     if status_reporter:
@@ -819,7 +1054,7 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                         cleanup_triggered = True
                         await task.cancel()
             except Exception as e:
-                logger.error(f"Error in participant_left handler: {e}")
+                logger.error("Error in participant_left handler: %s", e)
                 if not cleanup_triggered:
                     cleanup_triggered = True
                     await task.cancel()
@@ -835,11 +1070,14 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                 cleanup_triggered = True
                 await task.cancel()
 
+        # Opening line is fixed for the session, so build it once
+        default_greeting = opening_line or f"Hello! I'm {voice_id}, your AI assistant. How can I help you today?"
+
         @transport.event_handler("on_first_participant_joined")
         async def on_first_participant_joined(transport, participant_id):
             nonlocal transcription_reporter
 
-            logger.info(f"participant_joined participant_id={participant_id}")
+            logger.info("participant_joined participant_id=%s", participant_id)
 
             # Create transcription reporter after transport is connected
             transcription_reporter = TranscriptionReporter(transport)
@@ -849,20 +1087,29 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                 await status_reporter.report_ready()
 
             # Track conversation start time (non-blocking, non-critical)
-            await redis_tracker.track_conversation_start(room_name)
+            await redis_tracker.track_conversation_start()
 
-            # Pipeline stabilization delay
-            await asyncio.sleep(PARTICIPANT_GREETING_DELAY)
+            # Wait for the pipeline to be ready, bounded by the old fixed delay
+            try:
+                await asyncio.wait_for(pipeline_ready.wait(), timeout=PARTICIPANT_GREETING_DELAY)
+            except asyncio.TimeoutError:
+                pass
 
             # Send opening line
-            greeting = opening_line if opening_line else f"Hello! I'm {voice_id}, your AI assistant. How can I help you today?"
-            await task.queue_frame(TTSSpeakFrame(greeting))
-            logger.info(f"opening_line_sent")
+            await task.queue_frame(TTSSpeakFrame(default_greeting))
+            logger.info("opening_line_sent")
 
         @transport.event_handler("on_data_received")
         async def on_data_received(transport, data, participant_id):
+            # Chat messages are JSON objects; skip pings/binary blobs before
+            # paying for a parse that would only raise
+            if data[:1] not in (b"{", "{"):
+                return
             try:
-                json_data = json.loads(data)
+                json_data = orjson.loads(data)
+                # Marker frames are built per message on purpose: pipecat gives
+                # every frame a unique id (observers de-duplicate on it) and
+                # stamps per-frame pts/metadata, so instances can't be shared
                 await task.queue_frames([
                     InterruptionFrame(),
                     UserStartedSpeakingFrame(),
@@ -873,100 +1120,157 @@ async def main(voice_id="Ashley", opening_line=None, system_prompt=None):
                     ),
                     UserStoppedSpeakingFrame(),
                 ])
+            except orjson.JSONDecodeError as e:
+                logger.error("data_received_invalid_json: %s", e)
             except Exception as e:
-                logger.error(f"data_received_error: {e}")
+                logger.error("data_received_error: %s", e)
 
         # Disable PipelineRunner's built-in signal handling
         runner = PipelineRunner(handle_sigint=False)
 
-        # Start heartbeat task
-        logger.info(f"starting_heartbeat_task session_id={room_name}")
-        heartbeat_handle = asyncio.create_task(
-            heartbeat_task(room_name, transport, transcript_storage, heartbeat_session)
+        # Set by the heartbeat when the orchestrator reports insufficient credits
+        shutdown_event = asyncio.Event()
+
+        async def stop_on_shutdown():
+            """Cancel the pipeline once the heartbeat asks the session to stop."""
+            await shutdown_event.wait()
+            # Cancelling the task stops the transport; the runner then returns
+            # and cleanup runs in the finally block below
+            logger.info("Stopping pipeline due to insufficient credits")
+            await task.cancel()
+
+        logger.info("starting_heartbeat_task session_id=%s", room_name)
+        background_tasks = (
+            asyncio.create_task(heartbeat_task(room_name, heartbeat_session, shutdown_event)),
+            asyncio.create_task(transcript_checkpoint_task(room_name, transcript_storage)),
+            asyncio.create_task(stop_on_shutdown()),
         )
 
-        logger.info("pipeline_runner_starting")
-        await runner.run(task)
+        # The runner is awaited directly so a pipeline failure reaches the
+        # handlers below as itself; the background tasks end with it
+        try:
+            logger.info("pipeline_runner_starting")
+            await runner.run(task)
+        finally:
+            for background_task in background_tasks:
+                background_task.cancel()
+            await asyncio.gather(*background_tasks, return_exceptions=True)
 
     except KeyboardInterrupt:
         logger.info("keyboard_interrupt_received")
     except Exception as e:
-        logger.error(f"fatal_error: {e}", exc_info=True)
+        logger.error("fatal_error: %s", e, exc_info=True)
         # PRODUCTION FIX #6: Send error status
         if status_reporter:
             await status_reporter.report_error(str(e))
         raise
     finally:
-        logger.info(f"Cleanup initiated for session {room_name}")
-
-        # Cancel heartbeat task
-        if 'heartbeat_handle' in locals() and heartbeat_handle:
-            try:
-                heartbeat_handle.cancel()
-            except Exception:
-                pass
+        # Every cleanup line carries the session id
+        log = bind_logger(logger, session_id=room_name)
+        log.info("Cleanup initiated")
 
-        # Track conversation end (combines duration tracking and status update)
-        if 'redis_tracker' in locals() and redis_tracker:
-            await redis_tracker.track_conversation_end(room_name)
+        if transcription_reporter is not None:
+            transcription_reporter.close()
 
-        # Save transcripts to database
-        transcript_saved = False
-        if 'transcript_storage' in locals():
+        async def save_transcripts() -> bool:
+            """Save the collected transcript to the database; never raises."""
+            if transcript_storage is None:
+                return False
             if len(transcript_storage) == 0 and opening_line:
-                greeting = opening_line if opening_line else f"Hello! I'm {voice_id}, your AI assistant."
-                transcript_storage.add_message("assistant", greeting)
+                transcript_storage.add_message("assistant", opening_line)
+            if len(transcript_storage) == 0:
+                return False
+            try:
+                transcript_data = transcript_storage.get_transcript_data()
+                saved = await Database.save_transcript(room_name, transcript_data)
+                if saved:
+                    log.info("Transcripts saved: %d messages", len(transcript_data))
+                else:
+                    log.error("Failed to save transcripts")
+                return saved
+            except Exception as e:
+                log.error("Exception saving transcripts: %s", e)
+                return False
 
-            if len(transcript_storage) > 0:
+        async def close_heartbeat_session():
+            """Close the heartbeat HTTP session; never raises."""
+            if heartbeat_session is not None and not heartbeat_session.closed:
                 try:
-                    transcript_data = transcript_storage.get_transcript_data()
-                    transcript_saved = await Database.save_transcript(room_name, transcript_data)
-                    if transcript_saved:
-                        logger.info(f"Transcripts saved: {len(transcript_data)} messages")
-                    else:
-                        logger.error("Failed to save transcripts")
+                    await heartbeat_session.close()
+                    log.info("heartbeat_session_closed")
                 except Exception as e:
-                    logger.error(f"Exception saving transcripts: {e}")
+                    log.error("heartbeat_session_close_error: %s", e)
 
-        # Signal cleanup complete to orchestrator (CRITICAL: must happen after transcript save)
-        # This allows orchestrator to know it's safe to return from cleanup_session
-        if 'redis_tracker' in locals() and redis_tracker:
-            await redis_tracker.signal_cleanup_complete(room_name, transcript_saved)
+        # Conversation-end tracking (Redis), transcript save (Postgres) and the
+        # heartbeat session close are independent, so run them concurrently.
+        # Each swallows its own errors, so the group only raises on timeout
+        try:
+            async with asyncio.timeout(CLEANUP_SAVE_TIMEOUT):
+                async with asyncio.TaskGroup() as tg:
+                    if redis_tracker:
+                        tg.create_task(redis_tracker.track_conversation_end())
+                    save_handle = tg.create_task(save_transcripts())
+                    tg.create_task(close_heartbeat_session())
+        except asyncio.TimeoutError:
+            log.warning("cleanup_timeout stage=save timeout=%ss", CLEANUP_SAVE_TIMEOUT)
+        transcript_saved = False
+        if save_handle.done() and not save_handle.cancelled():
+            transcript_saved = save_handle.result()
 
-        # Close database connection
+        # Signal cleanup complete to orchestrator (CRITICAL: must happen after transcript save)
+        # This allows orchestrator to know it's safe to return from cleanup_session.
+        # The database pool is no longer needed either, so close it alongside
+        if db_warmup and not db_warmup.done():
+            db_warmup.cancel()
+        closers = {"database": Database.close()}
+        if redis_tracker:
+            closers["cleanup_signal"] = redis_tracker.signal_cleanup_complete(transcript_saved)
         try:
-            await Database.close()
-        except Exception as e:
-            logger.error(f"Error closing database: {e}")
+            async with asyncio.timeout(CLEANUP_SIGNAL_TIMEOUT):
+                results = await asyncio.gather(*closers.values(), return_exceptions=True)
+            for label, result in zip(closers, results):
+                if isinstance(result, Exception):
+                    log.error("Error in %s cleanup: %s", label, result)
+        except asyncio.TimeoutError:
+            log.warning("cleanup_timeout stage=close timeout=%ss", CLEANUP_SIGNAL_TIMEOUT)
 
-        # Close HTTP session
-        if 'session' in locals() and session and not session.closed:
-            try:
-                await session.close()
-            except Exception as e:
-                logger.error(f"session_close_error: {e}")
+        log.info("shutdown_complete")
 
-        # Close heartbeat session
-        if 'heartbeat_session' in locals() and heartbeat_session and not heartbeat_session.closed:
-            try:
-                await heartbeat_session.close()
-                logger.info("heartbeat_session_closed")
-            except Exception as e:
-                logger.error(f"heartbeat_session_close_error: {e}")
 
-        # Close Redis pool
-        if 'redis_pool' in locals() and redis_pool:
-            try:
-                await redis_pool.close()
-                await redis_pool.connection_pool.disconnect()
-                logger.info("redis_pool_closed")
-            except Exception as e:
-                logger.error(f"redis_pool_cleanup_error: {e}")
+async def run_agent(**kwargs):
+    """
+    Process entrypoint: run main() and release process-wide resources.
+
+    SIGTERM (sent by the orchestrator/worker on cleanup) cancels main() so its
+    finally block still saves the transcript and signals cleanup completion.
+    Only the first SIGTERM cancels: a repeated signal would otherwise cancel
+    the (concurrent, time-bounded) cleanup itself mid-save.
+    """
+    loop = asyncio.get_running_loop()
+    agent_task = asyncio.current_task()
 
-        logger.info("shutdown_complete")
+    def on_sigterm():
+        if agent_task.cancelling():
+            logger.info("sigterm_ignored reason=cleanup_in_progress")
+            return
+        agent_task.cancel()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+    except NotImplementedError:
+        pass  # Signal handlers are unavailable on Windows event loops
+
+    try:
+        await main(**kwargs)
+    finally:
+        # Both swallow their own errors; close them concurrently
+        await asyncio.gather(close_session(), close_redis())
 
 
 if __name__ == "__main__":
+    # CLI-only dependency: not loaded when the module is imported
+    import argparse
+
     parser = argparse.ArgumentParser(description='LiveKit Voice Assistant with Inworld TTS')
     parser.add_argument('--voice-id', type=str, default='Ashley')
     parser.add_argument('--opening-line', type=str, default=None)
@@ -975,14 +1279,25 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # uvloop's libuv-based event loop cuts per-callback overhead for the
+    # network-bound pipeline (LiveKit, STT/TTS streaming, Redis, Postgres)
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            logger.warning("uvloop_unavailable using=asyncio")
+
     try:
-        asyncio.run(main(
+        asyncio.run(run_agent(
             voice_id=args.voice_id,
             opening_line=args.opening_line,
             system_prompt=args.system_prompt
         ))
     except KeyboardInterrupt:
         logger.info("keyboard_interrupt_shutdown")
+    except asyncio.CancelledError:
+        logger.info("sigterm_shutdown")
     except Exception as e:
-        logger.error(f"unhandled_exception: {e}", exc_info=True)
+        logger.error("unhandled_exception: %s", e, exc_info=True)
         sys.exit(1)
@@ -19,9 +19,9 @@ broker_connection_retry_on_startup = True
 broker_connection_retry = True
 broker_connection_max_retries = 10
 
-# Result backend (for task status checking)
-result_backend = redis_url
-result_expires = 3600
+# No result backend: spawned tasks are fire-and-forget and revocation goes
+# through the broker, so storing task states only adds Redis writes
+task_ignore_result = True
 
 # Serialization
 task_serializer = 'json'
@@ -30,11 +30,6 @@ broker_transport_options = {
 worker_lost_wait = 20  # Seconds to wait for worker response before considering lost
 broker_heartbeat = 120  # Broker heartbeat interval (for AMQP, but good practice)
 
-# Result backend (task results storage)
-result_backend = redis_url
-result_expires = 3600  # Results expire after 1 hour
-result_persistent = False  # No need to persist results to disk
-
 # Serialization (JSON is safe and human-readable)
 task_serializer = 'json'
 result_serializer = 'json'
@@ -53,14 +48,9 @@ worker_cancel_long_running_tasks_on_connection_loss = True  # Cancel stuck tasks
 # Task execution settings - longer timeouts for agent spawning
 task_acks_late = True  # Acknowledge task after completion (not before)
 task_reject_on_worker_lost = True  # Re-queue task if worker dies
-task_track_started = True  # Track when task starts (not just when queued)
 task_time_limit = 300  # Hard time limit: 5 minutes (agent spawning can take time)
 task_soft_time_limit = 240  # Soft time limit: 4 minutes (raises exception)
 
-# Performance tuning
-result_compression = 'gzip'  # Compress results to save Redis memory
-result_cache_max = 1000  # Cache up to 1000 results in memory
-
 # Logging
 worker_log_format = '[%(asctime)s: %(levelname)s/%(processName)s] %(message)s'
 worker_task_log_format = '[%(asctime)s: %(levelname)s/%(processName)s][%(task_name)s(%(task_id)s)] %(message)s'
@@ -69,8 +59,9 @@ worker_task_log_format = '[%(asctime)s: %(levelname)s/%(processName)s][%(task_na
 beat_schedule_filename = '/tmp/celerybeat-schedule'  # Store schedule in tmp (ephemeral)
 beat_max_loop_interval = 10  # Check for new tasks every 10 seconds
 
-# Ignore result for these tasks (reduces Redis memory usage)
-task_ignore_result = False  # We want results for debugging
+# No result backend: nothing reads task results or states, so skip the
+# per-task Redis writes (restore result_backend if task states are needed)
+task_ignore_result = True
 
 # Task routes - explicitly route worker tasks to this worker service
 # (Orchestrator will publish tasks to default queue, workers consume from it)
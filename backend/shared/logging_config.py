@@ -69,6 +69,46 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name or "voice-agent")
 
 
+class BoundLogger(logging.LoggerAdapter):
+    """
+    Logger adapter that appends fixed key=value fields to every message.
+
+    Replaces structlog's logger.bind(): the fields are rendered once at bind
+    time and attached only to records that pass the level check, so callers
+    can keep lazy %-style arguments without repeating the context.
+
+    Usage:
+        log = bind_logger(logger, session_id=room_name)
+        log.info("transcripts_saved count=%d", n)
+    """
+    def __init__(self, logger: logging.Logger, fields: dict):
+        super().__init__(logger, fields)
+        suffix = "".join(f" {key}={value}" for key, value in fields.items())
+        self._suffix = suffix
+        # Messages with args are %-formatted, so literal '%' must be escaped
+        self._escaped_suffix = suffix.replace("%", "%%")
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.isEnabledFor(level):
+            msg = f"{msg}{self._escaped_suffix if args else self._suffix}"
+            msg, kwargs = self.process(msg, kwargs)
+            self.logger.log(level, msg, *args, **kwargs)
+
+
+def bind_logger(logger: logging.Logger, **fields) -> BoundLogger:
+    """
+    Bind context fields to a logger.
+
+    Args:
+        logger: Logger to wrap
+        **fields: Fields appended to every message as key=value
+
+    Returns:
+        BoundLogger instance
+    """
+    return BoundLogger(logger, fields)
+
+
 # Compatibility layer for gradual migration from structlog
 class LogContext:
     """
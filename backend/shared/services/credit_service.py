@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 from enum import Enum
 import asyncpg
 from asyncpg.pool import Pool
-import redis
+import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +39,26 @@ class CreditService:
                 raise ValueError("DATABASE_URL environment variable is not set")
 
             try:
+                # The orchestrator bills every running session from this one
+                # pool, so size it for MAX_BOTS rather than the per-agent
+                # DB_POOL_* limits. Keep max_size x orchestrator replicas plus
+                # the agents' pools under Postgres max_connections.
+                min_size = int(os.getenv('CREDIT_DB_POOL_MIN', '2'))
+                max_size = max(min_size, int(os.getenv('CREDIT_DB_POOL_MAX', '10')))
                 cls._pool = await asyncpg.create_pool(
                     database_url,
-                    min_size=1,
-                    max_size=5,
-                    command_timeout=10
+                    min_size=min_size,
+                    max_size=max_size,
+                    max_inactive_connection_lifetime=300,
+                    command_timeout=float(os.getenv('CREDIT_DB_COMMAND_TIMEOUT', '10')),
+                    # A handful of fixed queries run every billing tick; keep
+                    # their prepared statements for the connection's lifetime
+                    # instead of re-parsing them every 5 minutes
+                    max_cached_statement_lifetime=0,
+                    # The billing CTEs are parse/plan heavy but cheap to run
+                    server_settings={'jit': 'off'}
                 )
-                logger.info("Credit service database connection pool created successfully")
+                logger.info(f"Credit service database connection pool created successfully (min_size={min_size}, max_size={max_size})")
             except Exception as e:
                 logger.error(f"Failed to create database pool: {e}")
                 raise
@@ -53,17 +66,19 @@ class CreditService:
         return cls._pool
 
     @classmethod
-    def get_redis_client(cls) -> redis.Redis:
-        """Get or create Redis client"""
+    async def get_redis_client(cls) -> redis.Redis:
+        """Get or create async Redis client (never blocks the event loop)"""
         if cls._redis_client is None:
             redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-            cls._redis_client = redis.from_url(redis_url, decode_responses=True)
+            client = redis.from_url(redis_url, decode_responses=True)
             try:
-                cls._redis_client.ping()
+                await client.ping()
                 logger.info("Credit service Redis connection established")
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
+                await client.aclose()
                 raise
+            cls._redis_client = client
 
         return cls._redis_client
 
@@ -150,7 +165,7 @@ class CreditService:
         """
         Deduct 1 credit for a specific minute of conversation.
 
-        Uses Redis idempotency key to prevent double-charging.
+        Claims a Redis idempotency key (SET NX) to prevent double-charging.
         Creates audit trail in CreditTransaction table.
         Updates SimulationAttempt.minutesBilled to reflect total count of minutes billed.
 
@@ -166,11 +181,14 @@ class CreditService:
                 - student_id: Student ID (if found)
                 - balance_after: Remaining balance (if deducted)
         """
-        redis_client = cls.get_redis_client()
+        redis_client = await cls.get_redis_client()
         idempotency_key = f"credit:billed:{session_id}:{minute_number}"
 
-        # Check idempotency - already billed?
-        if redis_client.exists(idempotency_key):
+        # Claim the minute atomically with its 7-day TTL. A failed claim means
+        # another call already billed (or is billing) it; this closes the gap
+        # a separate EXISTS check left between concurrent ticks
+        claimed = await redis_client.set(idempotency_key, "1", nx=True, ex=7 * 24 * 60 * 60)
+        if not claimed:
             logger.info(f"Minute {minute_number} for session {session_id} already billed (idempotent)")
             return {
                 "result": CreditDeductionResult.ALREADY_BILLED,
@@ -179,70 +197,36 @@ class CreditService:
                 "minute_number": minute_number
             }
 
-        # Get student_id
-        student_id = await cls.get_student_id_from_session(session_id)
-        if not student_id:
-            logger.error(f"Cannot bill session {session_id}: SimulationAttempt not found")
-            return {
-                "result": CreditDeductionResult.SESSION_NOT_FOUND,
-                "message": "Session not found in database",
-                "session_id": session_id
-            }
-
+        deducted = False
         try:
             pool = await cls.get_pool()
 
             async with pool.acquire() as connection:
-                async with connection.transaction():
-                    # Lock and fetch student balance
-                    student_row = await connection.fetchrow(
-                        """
-                        SELECT credit_balance
-                        FROM students
-                        WHERE id = $1
-                        FOR UPDATE
-                        """,
-                        student_id
-                    )
-
-                    if not student_row:
-                        logger.error(f"Student {student_id} not found")
-                        return {
-                            "result": CreditDeductionResult.STUDENT_NOT_FOUND,
-                            "message": "Student not found",
-                            "student_id": student_id
-                        }
-
-                    current_balance = student_row['credit_balance']
-
-                    # Check sufficient credits
-                    if current_balance < 1:
-                        logger.warning(
-                            f"Insufficient credits for student {student_id}: "
-                            f"balance={current_balance}, required=1"
-                        )
-                        return {
-                            "result": CreditDeductionResult.INSUFFICIENT_CREDITS,
-                            "message": "Insufficient credits",
-                            "student_id": student_id,
-                            "balance": current_balance
-                        }
-
-                    # Deduct 1 credit
-                    new_balance = current_balance - 1
-                    await connection.execute(
-                        """
+                # Resolve the student, deduct, audit and record minutes_billed
+                # in one atomic statement. The balance guard makes the row
+                # lock implicit, so concurrent ticks never read-then-write a
+                # stale balance, and the attempt updates only fire when a
+                # credit was taken.
+                row = await connection.fetchrow(
+                    """
+                    WITH sa AS (
+                        SELECT student_id
+                        FROM simulation_attempts
+                        WHERE "correlationToken" = $1
+                        UNION ALL
+                        SELECT student_id
+                        FROM interview_simulation_attempts
+                        WHERE "correlationToken" = $1
+                        LIMIT 1
+                    ),
+                    upd AS (
                         UPDATE students
-                        SET credit_balance = $1
-                        WHERE id = $2
-                        """,
-                        new_balance,
-                        student_id
-                    )
-
-                    # Create CreditTransaction audit record
-                    await connection.execute(
-                        """
+                        SET credit_balance = credit_balance - 1
+                        FROM sa
+                        WHERE students.id = sa.student_id AND credit_balance >= 1
+                        RETURNING students.id, credit_balance
+                    ),
+                    ins AS (
                         INSERT INTO credit_transactions (
                             id,
                             student_id,
@@ -254,72 +238,83 @@ class CreditService:
                             description,
                             created_at
                         )
-                        VALUES (
+                        SELECT
                             gen_random_uuid(),
-                            $1,
+                            upd.id,
                             'DEBIT',
                             1,
-                            $2,
+                            upd.credit_balance,
                             'SIMULATION',
+                            $1,
                             $3,
-                            $4,
                             NOW()
-                        )
-                        """,
-                        student_id,
-                        new_balance,
-                        session_id,
-                        f"Voice simulation - minute {minute_number}"
+                        FROM upd
+                    ),
+                    sim AS (
+                        UPDATE simulation_attempts
+                        SET minutes_billed = $2
+                        WHERE "correlationToken" = $1 AND EXISTS (SELECT 1 FROM upd)
+                    ),
+                    interview AS (
+                        UPDATE interview_simulation_attempts
+                        SET minutes_billed = $2
+                        WHERE "correlationToken" = $1 AND EXISTS (SELECT 1 FROM upd)
                     )
+                    SELECT
+                        (SELECT student_id FROM sa) AS student_id,
+                        (SELECT credit_balance FROM upd) AS balance_after
+                    """,
+                    session_id,
+                    minute_number + 1,  # Store count, not minute number (0 -> 1, 1 -> 2, etc.)
+                    f"Voice simulation - minute {minute_number}"
+                )
+                student_id = row['student_id']
+                new_balance = row['balance_after']
 
-                    # Update SimulationAttempt.minutesBilled (store count, not minute number)
-                    # Determine which table contains the session and update only that table
-                    table_name = await connection.fetchval(
+                if not student_id:
+                    logger.error(f"Cannot bill session {session_id}: SimulationAttempt not found")
+                    return {
+                        "result": CreditDeductionResult.SESSION_NOT_FOUND,
+                        "message": "Session not found in database",
+                        "session_id": session_id
+                    }
+
+                if new_balance is None:
+                    # Nothing was deducted: tell a missing student from an empty balance
+                    current_balance = await connection.fetchval(
                         """
-                        SELECT 'simulation_attempts'::text
-                        FROM simulation_attempts
-                        WHERE "correlationToken" = $1
-                        UNION ALL
-                        SELECT 'interview_simulation_attempts'::text
-                        FROM interview_simulation_attempts
-                        WHERE "correlationToken" = $1
-                        LIMIT 1
+                        SELECT credit_balance
+                        FROM students
+                        WHERE id = $1
                         """,
-                        session_id
+                        student_id
                     )
-                    
-                    if table_name == 'simulation_attempts':
-                        result = await connection.execute(
-                            """
-                            UPDATE simulation_attempts
-                            SET minutes_billed = $1
-                            WHERE "correlationToken" = $2
-                            """,
-                            minute_number + 1,  # Convert minute number to count (0 -> 1, 1 -> 2, etc.)
-                            session_id
-                        )
-                    elif table_name == 'interview_simulation_attempts':
-                        result = await connection.execute(
-                            """
-                            UPDATE interview_simulation_attempts
-                            SET minutes_billed = $1
-                            WHERE "correlationToken" = $2
-                            """,
-                            minute_number + 1,  # Convert minute number to count (0 -> 1, 1 -> 2, etc.)
-                            session_id
-                        )
-                    else:
-                        logger.error(f"Session {session_id} not found in either table when updating minutes_billed")
-                        raise ValueError(f"Session {session_id} not found in database")
 
-                    logger.info(
-                        f"Credit deducted: student={student_id}, session={session_id}, "
-                        f"minute={minute_number}, balance: {current_balance} -> {new_balance}"
+                    if current_balance is None:
+                        logger.error(f"Student {student_id} not found")
+                        return {
+                            "result": CreditDeductionResult.STUDENT_NOT_FOUND,
+                            "message": "Student not found",
+                            "student_id": student_id
+                        }
+
+                    logger.warning(
+                        f"Insufficient credits for student {student_id}: "
+                        f"balance={current_balance}, required=1"
                     )
+                    return {
+                        "result": CreditDeductionResult.INSUFFICIENT_CREDITS,
+                        "message": "Insufficient credits",
+                        "student_id": student_id,
+                        "balance": current_balance
+                    }
 
-            # Transaction succeeded - set idempotency key with 7-day TTL
-            redis_client.setex(idempotency_key, 7 * 24 * 60 * 60, "1")
+                logger.info(
+                    f"Credit deducted: student={student_id}, session={session_id}, "
+                    f"minute={minute_number}, balance: {new_balance + 1} -> {new_balance}"
+                )
 
+            deducted = True
             return {
                 "result": CreditDeductionResult.SUCCESS,
                 "message": f"Successfully deducted 1 credit for minute {minute_number}",
@@ -340,6 +335,13 @@ class CreditService:
                 "session_id": session_id,
                 "error": str(e)
             }
+        finally:
+            if not deducted:
+                # Release the claim so a later tick or reconciliation can retry
+                try:
+                    await redis_client.delete(idempotency_key)
+                except Exception as e:
+                    logger.warning(f"Failed to release billing claim {idempotency_key}: {e}")
 
     @classmethod
     async def reconcile_session(cls, session_id: str, total_minutes: int) -> Dict[str, Any]:
@@ -402,22 +404,133 @@ class CreditService:
             minutes_billed_now = 0
             failed_minutes = []
 
-            for minute in range(last_billed, total_minutes):
-                result = await cls.deduct_minute(session_id, minute)
-
-                if result['result'] in [CreditDeductionResult.SUCCESS, CreditDeductionResult.ALREADY_BILLED]:
+            # Claim every candidate minute in one round-trip, the same SET NX
+            # claim deduct_minute takes. A minute held by another call (billed
+            # by a heartbeat tick, or being billed right now) counts as billed,
+            # as ALREADY_BILLED did; only our own claims are charged, so a
+            # concurrent tick can never bill the same minute twice
+            redis_client = await cls.get_redis_client()
+            minutes = range(last_billed, total_minutes)
+            claims = []
+            if minutes:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for minute in minutes:
+                        pipe.set(f"credit:billed:{session_id}:{minute}", "1", nx=True, ex=7 * 24 * 60 * 60)
+                    claims = await pipe.execute()
+            pending = []
+            for minute, claimed in zip(minutes, claims):
+                if claimed:
+                    pending.append(minute)
+                else:
                     minutes_billed_now += 1
-                elif result['result'] == CreditDeductionResult.INSUFFICIENT_CREDITS:
+
+            if pending:
+                billed_row = None
+                student_exists = True
+                try:
+                    async with pool.acquire() as connection:
+                        # Bill every claimed minute the balance covers in one
+                        # statement: deduct the total, write one audit row per
+                        # minute with its running balance, and advance
+                        # minutes_billed to the last minute actually billed
+                        billed_row = await connection.fetchrow(
+                            """
+                            WITH cur AS (
+                                SELECT id, credit_balance,
+                                       LEAST(cardinality($2::int[]), credit_balance) AS billed
+                                FROM students
+                                WHERE id = $1 AND credit_balance >= 1
+                                FOR UPDATE
+                            ),
+                            minutes AS (
+                                SELECT t.minute, t.ord
+                                FROM cur, unnest($2::int[]) WITH ORDINALITY AS t(minute, ord)
+                                WHERE t.ord <= cur.billed
+                            ),
+                            upd AS (
+                                UPDATE students s
+                                SET credit_balance = s.credit_balance - cur.billed
+                                FROM cur
+                                WHERE s.id = cur.id
+                            ),
+                            ins AS (
+                                INSERT INTO credit_transactions (
+                                    id,
+                                    student_id,
+                                    transaction_type,
+                                    amount,
+                                    balance_after,
+                                    source_type,
+                                    source_id,
+                                    description,
+                                    created_at
+                                )
+                                SELECT
+                                    gen_random_uuid(),
+                                    cur.id,
+                                    'DEBIT',
+                                    1,
+                                    cur.credit_balance - minutes.ord,
+                                    'SIMULATION',
+                                    $3,
+                                    'Voice simulation - minute ' || minutes.minute,
+                                    NOW()
+                                FROM cur, minutes
+                            ),
+                            sim AS (
+                                UPDATE simulation_attempts
+                                SET minutes_billed = (SELECT max(minute) + 1 FROM minutes)
+                                WHERE "correlationToken" = $3 AND EXISTS (SELECT 1 FROM minutes)
+                            ),
+                            interview AS (
+                                UPDATE interview_simulation_attempts
+                                SET minutes_billed = (SELECT max(minute) + 1 FROM minutes)
+                                WHERE "correlationToken" = $3 AND EXISTS (SELECT 1 FROM minutes)
+                            )
+                            SELECT credit_balance, billed FROM cur
+                            """,
+                            student_id,
+                            pending,
+                            session_id
+                        )
+
+                        if billed_row is None:
+                            student_exists = await connection.fetchval(
+                                "SELECT 1 FROM students WHERE id = $1",
+                                student_id
+                            )
+                finally:
+                    # Release claims on minutes that weren't charged (or all of
+                    # them if the statement failed) so a later call can retry
+                    unbilled = pending[billed_row['billed']:] if billed_row else pending
+                    if unbilled:
+                        try:
+                            await redis_client.delete(
+                                *(f"credit:billed:{session_id}:{minute}" for minute in unbilled)
+                            )
+                        except Exception as e:
+                            logger.warning(f"Failed to release billing claims for session {session_id}: {e}")
+
+                billed = billed_row['billed'] if billed_row else 0
+                minutes_billed_now += billed
+
+                if billed:
+                    balance_before = billed_row['credit_balance']
+                    logger.info(
+                        f"Credits deducted in reconciliation: student={student_id}, session={session_id}, "
+                        f"minutes={pending[:billed]}, balance: {balance_before} -> {balance_before - billed}"
+                    )
+
+                if not student_exists:
+                    logger.error(f"Failed to bill minutes {pending}: student {student_id} not found")
+                    failed_minutes.extend(pending)
+                elif billed < len(pending):
                     logger.warning(
                         f"Insufficient credits during reconciliation: "
-                        f"session={session_id}, minute={minute}"
+                        f"session={session_id}, minute={pending[billed]}"
                     )
-                    failed_minutes.append(minute)
-                    # Stop billing on insufficient credits
-                    break
-                else:
-                    logger.error(f"Failed to bill minute {minute}: {result['message']}")
-                    failed_minutes.append(minute)
+                    # Billing stops at the first minute the balance can't cover
+                    failed_minutes.append(pending[billed])
 
             final_billed = last_billed + minutes_billed_now
 
@@ -466,7 +579,7 @@ class CreditService:
 
         if cls._redis_client:
             try:
-                cls._redis_client.close()
+                await cls._redis_client.aclose()
                 cls._redis_client = None
                 logger.info("Credit service Redis connection closed")
             except Exception as e:
@@ -1,108 +1,184 @@
-import json
+import asyncio
 import logging
 import os
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncpg
+import orjson
 from asyncpg.pool import Pool
+from asyncpg.prepared_stmt import PreparedStatement
 
 logger = logging.getLogger(__name__)
 
+# JSONB binary wire format: a version byte followed by the JSON text
+_JSONB_VERSION = b'\x01'
+
+
+# Version tag stored in every transcript envelope
+_ENVELOPE_VERSION = "1.0"
+
+
+def _dumps_json(value) -> bytes:
+    """Serialize a Python object to JSON bytes (datetimes as UTC with a Z suffix)"""
+    return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+
+def _encode_jsonb(value) -> bytes:
+    """Encode a Python object into the binary jsonb wire format"""
+    return _JSONB_VERSION + _dumps_json(value)
+
+
+def _decode_jsonb(data: bytes):
+    """Decode the binary jsonb wire format into a Python object"""
+    return orjson.loads(data[1:])
+
+
+# Transcript tables in lookup order; a correlationToken lives in exactly one of them.
+# The single-row UPDATEs are prepared once per pooled connection.
+_TRANSCRIPT_UPDATE_SQL = {
+    'simulation_attempts': """
+        UPDATE simulation_attempts
+        SET transcript = $1
+        WHERE "correlationToken" = $2
+        RETURNING 1
+    """,
+    'interview_simulation_attempts': """
+        UPDATE interview_simulation_attempts
+        SET transcript = $1
+        WHERE "correlationToken" = $2
+        RETURNING 1
+    """,
+}
+
+
+class TranscriptConnection(asyncpg.Connection):
+    """Pooled connection that carries the prepared transcript statements"""
+
+    # Set by Database._init_connection; deliberately no class-level default,
+    # so a connection whose init failed raises instead of updating nothing
+    transcript_updates: Dict[str, PreparedStatement]
+
 
 class Database:
     """Database service for handling transcript storage using asyncpg"""
 
     _pool: Optional[Pool] = None
+    _init_lock: Optional[asyncio.Lock] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_init_lock(cls) -> asyncio.Lock:
+        """
+        Get the pool init lock for the running event loop.
+
+        The pool and lock are both bound to the loop that created
+        them, so state left behind by a different (possibly closed) loop is
+        discarded rather than reused.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls._loop = loop
+            cls._init_lock = asyncio.Lock()
+            cls._pool = None
+        return cls._init_lock
 
     @classmethod
     async def get_pool(cls) -> Pool:
         """Get or create database connection pool"""
-        if cls._pool is None:
-            database_url = os.getenv('DATABASE_URL')
-            if not database_url:
-                raise ValueError("DATABASE_URL environment variable is not set")
-
-            try:
-                cls._pool = await asyncpg.create_pool(
-                    database_url,
-                    min_size=1,
-                    max_size=3,
-                    command_timeout=10
-                )
-                logger.info("Database connection pool created successfully")
-            except Exception as e:
-                logger.error(f"Failed to create database pool: {e}")
-                raise
+        if cls._pool is not None and cls._loop is asyncio.get_running_loop():
+            return cls._pool
+
+        # Double-checked under the lock so concurrent first callers share one pool
+        async with cls._get_init_lock():
+            if cls._pool is None:
+                database_url = os.getenv('DATABASE_URL')
+                if not database_url:
+                    raise ValueError("DATABASE_URL environment variable is not set")
+
+                try:
+                    # One connection is held for the call: the codec and
+                    # prepared statements are set up once and reused by every
+                    # checkpoint and the shutdown save. The idle timeout must
+                    # stay above the checkpoint interval or each save reconnects
+                    min_size = int(os.getenv('DB_POOL_MIN', '1'))
+                    max_size = max(min_size, int(os.getenv('DB_POOL_MAX', '3')))
+                    cls._pool = await asyncpg.create_pool(
+                        database_url,
+                        min_size=min_size,
+                        max_size=max_size,
+                        max_inactive_connection_lifetime=float(os.getenv('DB_POOL_IDLE_TIMEOUT', '300')),
+                        command_timeout=10,
+                        # Trivial keyed UPDATEs: skip JIT and reuse one generic plan.
+                        # These connections only write transcripts, so commits
+                        # needn't wait for the WAL fsync; an acknowledged save can
+                        # be lost only if the server itself crashes right after
+                        server_settings={
+                            'jit': 'off',
+                            'plan_cache_mode': 'force_generic_plan',
+                            'synchronous_commit': 'off',
+                        },
+                        connection_class=TranscriptConnection,
+                        init=cls._init_connection
+                    )
+                    logger.info(f"Database connection pool created successfully (min_size={min_size}, max_size={max_size})")
+                except Exception as e:
+                    logger.error(f"Failed to create database pool: {e}")
+                    raise
 
         return cls._pool
 
+    @staticmethod
+    async def _init_connection(connection: TranscriptConnection):
+        """
+        Prepare a pooled connection for transcript writes.
+
+        Registers the binary jsonb codec so payloads skip server-side text
+        parsing, then prepares the transcript statements once so each save
+        skips the parse/plan round-trip. The codec must be registered first
+        because prepared statements bind their codecs at prepare time.
+        """
+        await connection.set_type_codec(
+            'jsonb',
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema='pg_catalog',
+            format='binary'
+        )
+        connection.transcript_updates = {
+            table_name: await connection.prepare(sql)
+            for table_name, sql in _TRANSCRIPT_UPDATE_SQL.items()
+        }
+
     @classmethod
     async def save_transcript(cls, correlation_token: str, transcript_data: List[Dict]) -> bool:
         """Save transcript to simulation_attempts or interview_simulation_attempts table"""
         try:
             pool = await cls.get_pool()
 
-            # Prepare transcript JSON
+            # Prepare transcript JSON (encoded by the jsonb codec registered on the pool)
             transcript_json = {
                 "messages": transcript_data,
-                "capturedAt": datetime.utcnow().isoformat(),
-                "version": "1.0"
+                "capturedAt": datetime.now(timezone.utc),
+                "version": _ENVELOPE_VERSION
             }
 
-            # Determine which table contains the session and update only that table
+            # Try the tables in lookup order so the token is updated in exactly
+            # one of them without a separate lookup round-trip. pool.execute()
+            # isn't used because it re-acquires per statement and can't reach
+            # the prepared handles living on the connection
+            table_name = None
             async with pool.acquire() as connection:
-                table_name = await connection.fetchval(
-                    """
-                    SELECT 'simulation_attempts'::text
-                    FROM simulation_attempts
-                    WHERE "correlationToken" = $1
-                    UNION ALL
-                    SELECT 'interview_simulation_attempts'::text
-                    FROM interview_simulation_attempts
-                    WHERE "correlationToken" = $1
-                    LIMIT 1
-                    """,
-                    correlation_token
-                )
-
-                if not table_name:
-                    logger.warning(f"No simulation_attempts or interview_simulation_attempts record found for correlationToken: {correlation_token}")
-                    return False
-
-                # Update the appropriate table
-                if table_name == 'simulation_attempts':
-                    result = await connection.execute(
-                        """
-                        UPDATE simulation_attempts
-                        SET transcript = $1::jsonb
-                        WHERE "correlationToken" = $2
-                        """,
-                        json.dumps(transcript_json),
-                        correlation_token
-                    )
-                elif table_name == 'interview_simulation_attempts':
-                    result = await connection.execute(
-                        """
-                        UPDATE interview_simulation_attempts
-                        SET transcript = $1::jsonb
-                        WHERE "correlationToken" = $2
-                        """,
-                        json.dumps(transcript_json),
-                        correlation_token
-                    )
-                else:
-                    logger.error(f"Unexpected table name: {table_name}")
-                    return False
-
-                # Check if any rows were updated
-                rows_affected = int(result.split()[-1]) if result else 0
-
-                if rows_affected > 0:
-                    logger.info(f"Transcript saved for {correlation_token} in {table_name}: {len(transcript_data)} messages")
-                    return True
-                else:
-                    logger.warning(f"Failed to update transcript for correlationToken: {correlation_token} in {table_name}")
-                    return False
+                for candidate, update_statement in connection.transcript_updates.items():
+                    if await update_statement.fetchval(transcript_json, correlation_token):
+                        table_name = candidate
+                        break
+
+            if table_name:
+                logger.info(f"Transcript saved for {correlation_token} in {table_name}: {len(transcript_data)} messages")
+                return True
+            else:
+                logger.warning(f"No simulation_attempts or interview_simulation_attempts record found for correlationToken: {correlation_token}")
+                return False
 
         except asyncpg.exceptions.UndefinedTableError as e:
             logger.error(f"Table does not exist: {e}")